@@ -148,7 +148,7 @@ pub fn arg0<'a>(node: &'a KdlNode) -> Result<&'a KdlEntry, KdlDiagnostic> {
 
 pub fn args(node: &kdl::KdlNode) -> Result<impl Iterator<Item = &KdlEntry>, KdlDiagnostic> {
     let entries = node.entries().iter().filter(|e| e.name().is_none());
-    if entries.clone().count() == 0 {
+    if entries.clone().next().is_none() {
         return Err(diag!(
             node.span(),
             message = format!("node '{}' requires at least one argument", node.name().value())
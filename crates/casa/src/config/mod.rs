@@ -7,7 +7,7 @@ use indexmap::IndexMap;
 use kdl::{KdlDiagnostic, KdlDocument, KdlEntry, KdlNode, KdlValue};
 use kdl_helpers::{self as h, FromKdlEntry, KdlDocumentExt};
 use miette::{Severity, SourceSpan};
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 use strum::{self, VariantNames};
 
 mod error;
@@ -108,55 +108,15 @@ impl Config {
                         });
                     }
                     "cp" => {
-                        let source_entry = h::arg0(bundle_item)?;
-                        let source = dotfiles_dir.join(String::from_kdl_entry(source_entry)?);
-                        if !source.exists() {
-                            return Err(ConfigDiagnostic::path_not_found(
-                                source_entry,
-                                source.display().to_string(),
-                            ));
-                        }
-                        let target = h::arg(bundle_item, 1)
-                            .map_err(Into::into)
-                            .and_then(|entry| current_env_map.expand_kdl_entry(entry))?;
-                        // let target_path = if target.replacement_count > 0 {
-                        //     PathBuf::from(&target.value)
-                        // } else {
-                        //     let path = PathBuf::from(env_map.get("HOME").unwrap());
-                        //     path.join(&target.value)
-                        // };
-                        let target_path = PathBuf::from(&target);
-                        items.push(BundleItem::Copy {
-                            source,
-                            target: target_path,
-                            span: bundle_item.span(),
-                        });
+                        let (source, target) =
+                            current_env_map.expand_kdl_transfer(bundle_item, &dotfiles_dir)?;
+                        items.push(BundleItem::Copy { source, target, span: bundle_item.span() });
                     }
                     "ln" => {
                         // same as cp but creates a symlink instead of copying
-                        let source_entry = h::arg0(bundle_item)?;
-                        let source = dotfiles_dir.join(String::from_kdl_entry(source_entry)?);
-                        if !source.exists() {
-                            return Err(ConfigDiagnostic::path_not_found(
-                                source_entry,
-                                source.display().to_string(),
-                            ));
-                        }
-                        let target = h::arg(bundle_item, 1)
-                            .map_err(Into::into)
-                            .and_then(|entry| current_env_map.expand_kdl_entry(entry))?;
-                        // let target_path = if target.replacement_count > 0 {
-                        //     PathBuf::from(&target.value)
-                        // } else {
-                        //     let path = PathBuf::from(env_map.get("HOME").unwrap());
-                        //     path.join(&target.value)
-                        // };
-                        let target_path = PathBuf::from(&target);
-                        items.push(BundleItem::Link {
-                            source,
-                            target: target_path,
-                            span: bundle_item.span(),
-                        });
+                        let (source, target) =
+                            current_env_map.expand_kdl_transfer(bundle_item, &dotfiles_dir)?;
+                        items.push(BundleItem::Link { source, target, span: bundle_item.span() });
                     }
                     "source" => {
                         let snippet = h::arg(bundle_item, 0).and_then(String::from_kdl_entry)?;
@@ -341,6 +301,31 @@ impl Env {
         }
     }
 
+    /// `SOURCE TARGET` arguments shared by the `cp` and `ln` bundle items
+    fn expand_kdl_transfer(
+        &self,
+        node: &KdlNode,
+        dotfiles_dir: &Path,
+    ) -> Result<(PathBuf, PathBuf), ConfigDiagnostic> {
+        let source_entry = h::arg0(node)?;
+        let source = dotfiles_dir.join(String::from_kdl_entry(source_entry)?);
+        if !source.exists() {
+            return Err(ConfigDiagnostic::path_not_found(
+                source_entry,
+                source.display().to_string(),
+            ));
+        }
+        let target =
+            h::arg(node, 1).map_err(Into::into).and_then(|entry| self.expand_kdl_entry(entry))?;
+        // let target_path = if target.replacement_count > 0 {
+        //     PathBuf::from(&target.value)
+        // } else {
+        //     let path = PathBuf::from(env_map.get("HOME").unwrap());
+        //     path.join(&target.value)
+        // };
+        Ok((source, PathBuf::from(target)))
+    }
+
     pub fn expand_kdl_entry_dir_exists(
         &self,
         entry: &KdlEntry,
@@ -3,7 +3,6 @@ use minijinja::value::{Enumerator, Object, ObjectExt, Value, from_args};
 
 impl Object for Env {
     fn get_value(self: &std::sync::Arc<Self>, key: &Value) -> Option<Value> {
-        dbg!(key);
         if let Some(key) = key.as_str() {
             if let Some(value) = self.get_str(key) {
                 return Some(Value::from(value));
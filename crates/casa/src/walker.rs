@@ -1,4 +1,3 @@
-use std::ffi::OsString;
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
 
@@ -7,7 +6,7 @@ use crate::dir_entry::{DirEntry, Source};
 #[derive(Debug)]
 struct WalkerActionPlanner<T> {
     // target: PathBuf,
-    sources: Vec<(Arc<Source<T>>, OsString)>, // (root, top-level name)
+    sources: Vec<Arc<Source<T>>>,
     current_idx: usize,
 }
 
@@ -25,8 +24,7 @@ impl WalkerActionPlanner<()> {
 
 impl<T> WalkerActionPlanner<T> {
     fn add_source(&mut self, source: Source<T>) {
-        let name = source.path.file_name().expect("source must have a file name").to_os_string();
-        self.sources.push((Arc::new(source), name));
+        self.sources.push(Arc::new(source));
     }
 
     fn add<P: AsRef<Path>>(&mut self, src: P, target: P, data: T) {
@@ -54,7 +52,7 @@ impl<T> WalkerActionPlanner<T> {
         }
 
         // Current source we’re in
-        let (ref source, ref _top_name) = self.sources[self.current_idx - 1];
+        let source = &self.sources[self.current_idx - 1];
 
         if let Ok(rel) = path.as_ref().strip_prefix(&source.path) {
             let target_len = source.target.as_os_str().len();
@@ -89,9 +87,9 @@ impl<T> WalkerBuilder<T> {
     }
 
     pub fn build(self) -> Walker<T> {
-        let mut walker_builder = ignore::WalkBuilder::new(self.planner.sources[0].0.path.clone());
+        let mut walker_builder = ignore::WalkBuilder::new(self.planner.sources[0].path.clone());
         for source in self.planner.sources.iter().skip(1) {
-            walker_builder.add(source.0.path.clone());
+            walker_builder.add(source.path.clone());
         }
         Walker { walk: walker_builder.build(), planner: self.planner }
     }